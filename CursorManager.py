@@ -1,90 +1,158 @@
 import os
 import sys
 import json
-import time
-import secrets
+import binascii
 import platform
 import ctypes
-import shutil
+import functools
+import subprocess
+import stat
+import threading
 from pathlib import Path
 from typing import Optional, Dict
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QPushButton, 
-    QVBoxLayout, QWidget, QLabel, QSpacerItem, 
-    QSizePolicy, QHBoxLayout, QTabWidget, QTextEdit, QProgressBar
+    QApplication, QMainWindow, QPushButton,
+    QVBoxLayout, QWidget, QLabel,
+    QHBoxLayout, QTabWidget, QTextEdit, QProgressBar
 )
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QFont, QIcon
-from plyer import notification
 import sqlite3
 import uuid
+from datetime import datetime, timezone
+
+_QSS_OK = "color: #27ae60; font-weight: bold;"
+_QSS_ERR = "color: #e74c3c; font-weight: bold;"
+_QSS_BY_STATE = {"ok": _QSS_OK, "err": _QSS_ERR}
 
 # -------------------- Database Manager Class --------------------
 class DatabaseManager:
     """SQLite veritabanı yönetimi."""
+    # Sorgu metinleri sabit tutulur; sqlite3 derlenmiş ifadeyi önbellekten yeniden kullanır
+    _q_last_op = "SELECT operation, timestamp FROM operations ORDER BY id DESC LIMIT 1"
+    _q_id_rows = "SELECT operation, timestamp FROM operations WHERE category = ? ORDER BY id DESC LIMIT ?"
+    ID_HISTORY_LIMIT = 200
+
     def __init__(self, db_path="operations.db"):
         self.db_path = db_path
+        self._lock = threading.Lock()
+        self._closed = False
         self.connection = self.connect_db()
+        self._w_cur = self.connection.cursor()
+        self._r_cur = self.connection.cursor()
         self.create_table()
+        self._last_op_cache = None
+        self._id_rows_cache = None
 
     def connect_db(self):
         """Veritabanına bağlanır."""
-        conn = sqlite3.connect(self.db_path)
+        # GUI ve worker thread'leri aynı bağlantıyı paylaşır; transaction'lar elle yönetilir
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
+    def _write(self, callback):
+        """Verilen yazma işlemini kilit altında tek bir transaction içinde çalıştırır."""
+        with self._lock:
+            if self._closed:
+                return False
+            self._w_cur.execute("BEGIN")
+            try:
+                callback(self._w_cur)
+            except Exception:
+                self._w_cur.execute("ROLLBACK")
+                raise
+            self._w_cur.execute("COMMIT")
+            return True
+
     def create_table(self):
         """İşlem geçmişini tutacak tabloyu oluşturur."""
-        cursor = self.connection.cursor()
-        cursor.execute('''CREATE TABLE IF NOT EXISTS operations (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            operation TEXT NOT NULL,
-                            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP)''')
-        self.connection.commit()
-
-    def insert_operation(self, operation):
+        def create(cursor):
+            cursor.execute('''CREATE TABLE IF NOT EXISTS operations (
+                                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                operation TEXT NOT NULL,
+                                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                                category TEXT)''')
+
+            # Eski veritabanlarında category sütunu yoksa ekle ve mevcut kayıtları doldur
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(operations)").fetchall()]
+            if "category" not in columns:
+                cursor.execute("ALTER TABLE operations ADD COLUMN category TEXT")
+                cursor.execute("UPDATE operations SET category = CASE WHEN operation LIKE 'ID%' THEN 'ID' ELSE 'UPDATE' END")
+
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ops_cat_id ON operations(category, id DESC)")
+
+        self._write(create)
+
+    def insert_operation(self, operation, category):
         """Veritabanına yeni bir işlem kaydeder."""
-        cursor = self.connection.cursor()
-        cursor.execute("INSERT INTO operations (operation) VALUES (?)", (operation,))
-        self.connection.commit()
+        self.insert_operations([operation], category)
+
+    def insert_operations(self, operations, category):
+        """Birden fazla işlemi tek bir transaction içinde kaydeder."""
+        written = self._write(lambda cursor: cursor.executemany(
+            "INSERT INTO operations (operation, category) VALUES (?, ?)",
+            [(operation, category) for operation in operations]
+        ))
+        if not written:
+            return
+
+        # Önbellekleri SQLite'ın CURRENT_TIMESTAMP formatıyla (UTC) güncelle
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        if operations:
+            self._last_op_cache = (operations[-1], now)
+        if category == "ID" and self._id_rows_cache is not None:
+            new_rows = [(operation, now) for operation in reversed(operations)]
+            self._id_rows_cache = (new_rows + self._id_rows_cache)[:self.ID_HISTORY_LIMIT]
 
     def get_last_operation(self):
         """En son yapılan işlemi getirir."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT operation, timestamp FROM operations ORDER BY id DESC LIMIT 1")
-        result = cursor.fetchone()
-        return result if result else ("Henüz işlem yapılmadı", None)
+        if self._last_op_cache is not None:
+            return self._last_op_cache
+        with self._lock:
+            self._r_cur.execute(self._q_last_op)
+            result = self._r_cur.fetchone()
+        if not result:
+            return ("Henüz işlem yapılmadı", None)
+        self._last_op_cache = result
+        return result
+
+    def get_id_rows(self):
+        """Son değiştirilen ID kayıtlarını (en yeni önce) getirir."""
+        if self._id_rows_cache is None:
+            with self._lock:
+                self._r_cur.execute(self._q_id_rows, ("ID", self.ID_HISTORY_LIMIT))
+                self._id_rows_cache = self._r_cur.fetchall()
+        return self._id_rows_cache
 
     def close(self):
-        """Veritabanı bağlantısını kapatır."""
-        self.connection.close()
+        """WAL dosyasını ana veritabanına aktarır ve bağlantıyı kapatır."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self.connection.close()
 
 # -------------------- ID Generator Class --------------------
 class IDGenerator:
     """Rastgele benzersiz kimlikler (UUID, MAC ID) üretir."""
 
     @staticmethod
-    def simulate_work():
-        time.sleep(0.8)
-
-    @staticmethod
-    def generate_machine_id() -> str:
-        """Makine kimliği için rastgele bir hex değeri üretir."""
-        return secrets.token_hex(32)
-
-    @staticmethod
-    def generate_mac_machine_id() -> str:
-        """MAC makine kimliği için rastgele bir hex değeri üretir."""
-        return secrets.token_hex(32)
-
-    @staticmethod
-    def generate_device_id() -> str:
-        """UUID formatında bir cihaz kimliği üretir."""
-        return str(uuid.uuid4())
-
-    @staticmethod
-    def generate_sqm_id() -> str:
-        """SQM ID için UUID formatında bir değer üretir."""
-        return str(uuid.uuid4())
+    def generate_all() -> Dict[str, str]:
+        """Tüm kimlikleri tek bir os.urandom çağrısından üretir."""
+        raw = os.urandom(32 + 32 + 16 + 16)
+        h = binascii.hexlify(raw[:64]).decode()
+        return {
+            "machine_id": h[:64],
+            "mac_machine_id": h[64:128],
+            "device_id": str(uuid.UUID(bytes=raw[64:80], version=4)),
+            "sqm_id": str(uuid.UUID(bytes=raw[80:96], version=4)),
+        }
 
 # -------------------- Config Manager Class --------------------
 class ConfigManager:
@@ -95,7 +163,7 @@ class ConfigManager:
         self.config_path = self.get_config_path()
 
     def get_config_path(self) -> Path:
-        if platform.system() == "Windows":
+        if _system() == "Windows":
             return Path(f"C:/Users/{self.username}/AppData/Roaming/Cursor/storage.json")
         else:
             return Path.home() / ".config/Cursor/storage.json"
@@ -113,14 +181,20 @@ class ConfigManager:
     def save_config(self, config: Dict) -> bool:
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Yarım kalan yazma storage.json'u bozmasın diye önce geçici dosyaya yaz
+            data = json.dumps(config, indent=2).encode()
+            tmp_path = self.config_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.config_path)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
 
 # -------------------- Utility Functions --------------------
+# İşletim sistemi süreç boyunca değişmez; sonucu bir kez hesapla
+_system = functools.lru_cache(maxsize=1)(platform.system)
+
 def resource_path(relative_path: str) -> str:
     """ PyInstaller ile paketlendiğinde dosya yolunu çözer."""
     try:
@@ -129,9 +203,10 @@ def resource_path(relative_path: str) -> str:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+@functools.lru_cache(maxsize=1)
 def is_admin() -> bool:
     """ Programın yönetici yetkisiyle çalışıp çalışmadığını kontrol eder."""
-    if platform.system() == "Windows":
+    if _system() == "Windows":
         try:
             return ctypes.windll.shell32.IsUserAnAdmin()
         except:
@@ -139,27 +214,185 @@ def is_admin() -> bool:
     else:
         return os.geteuid() == 0
 
+def is_link_or_junction(path) -> bool:
+    """ Yolun sembolik bağlantı veya Windows junction (reparse point) olup olmadığını döndürür."""
+    if os.path.islink(path):
+        return True
+    try:
+        attributes = getattr(os.lstat(path), "st_file_attributes", 0)
+    except OSError:
+        return False
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def remove_link(path):
+    """ Bağlantının kendisini siler; hedefine dokunmaz."""
+    try:
+        os.unlink(path)
+    except OSError:
+        # Dizin junction'ları Windows'ta rmdir ile kaldırılır
+        os.rmdir(path)
+
+def fast_rmtree(path):
+    """ Küçük dizin ağaçlarını os.scandir ile doğrudan siler."""
+    # shutil.rmtree gibi bağlantıları ve junction'ları reddet; aksi halde hedef dizin boşaltılır
+    if is_link_or_junction(path):
+        raise OSError(f"Sembolik bağlantı silinemez: {path}")
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if is_link_or_junction(entry.path):
+                remove_link(entry.path)
+            elif entry.is_dir(follow_symlinks=False):
+                fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def set_label_state(label: QLabel, state: str):
+    """ Etiketin rengini değiştirir; durum aynıysa stil sayfası yeniden uygulanmaz."""
+    if label.property("_qss_state") == state:
+        return
+    label.setStyleSheet(_QSS_BY_STATE[state])
+    label.setProperty("_qss_state", state)
+
+def send_notification(title: str, message: str):
+    """ Masaüstü bildirimi gönderir; bildirim altyapısı yoksa sessizce geçer."""
+    try:
+        from plyer import notification  # İlk bildirimde yüklenir, başlangıcı hızlandırır
+        notification.notify(title=title, message=message, timeout=5)
+    except Exception:
+        pass
+
 def kill_cursor_processes():
     """ Cursor uygulamasını kapatır."""
-    if platform.system() == "Windows":
-        os.system("taskkill /F /IM Cursor.exe 2>nul")
-    else:
-        os.system("pkill -f Cursor")
+    # En iyi çaba: komut bulunamazsa (ör. pkill yoksa) sessizce devam et
+    try:
+        if _system() == "Windows":
+            subprocess.run(
+                ["taskkill", "/F", "/IM", "Cursor.exe"],
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+        else:
+            subprocess.run(
+                ["pkill", "-f", "Cursor"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+    except OSError:
+        pass
+
+# -------------------- Worker Classes --------------------
+class UpdateWorker(QThread):
+    """Güncelleme engelleme/açma işlemini arayüzü dondurmadan arka planda yürütür."""
+    progress = Signal(int)
+    done = Signal(bool, str)
+
+    def __init__(self, updater_path: Path, block: bool, parent=None):
+        super().__init__(parent)
+        self.updater_path = updater_path
+        self.block = block
+
+    def run(self):
+        try:
+            # Her dosya sistemi adımı bir ilerleme birimi sayılır
+            steps = []
+            if is_link_or_junction(self.updater_path):
+                # Bağlantının kendisini sil, hedefine asla girme
+                steps.append(lambda: remove_link(self.updater_path))
+            elif self.updater_path.is_dir():
+                with os.scandir(self.updater_path) as entries:
+                    for entry in entries:
+                        if is_link_or_junction(entry.path):
+                            steps.append(lambda p=entry.path: remove_link(p))
+                        elif entry.is_dir(follow_symlinks=False):
+                            steps.append(lambda p=entry.path: fast_rmtree(p))
+                        else:
+                            steps.append(lambda p=entry.path: os.unlink(p))
+                steps.append(self.updater_path.rmdir)
+            elif self.updater_path.exists():
+                steps.append(self.updater_path.unlink)
+
+            if self.block:
+                steps.append(self.updater_path.touch)
+            else:
+                steps.append(lambda: self.updater_path.mkdir(parents=True))
+
+            total = len(steps)
+            for step_no, step in enumerate(steps, start=1):
+                step()
+                self.progress.emit(int(step_no * 100 / total))
+
+            self.done.emit(True, "")
+        except Exception as e:
+            self.done.emit(False, str(e))
+
+class IDChangeWorker(QThread):
+    """Yeni ID'leri üretir ve Cursor'u arka planda kapatır."""
+    done = Signal(bool, dict, str)
+
+    def run(self):
+        try:
+            ids = IDGenerator.generate_all()
+            kill_cursor_processes()
+            self.done.emit(True, ids, "")
+        except Exception as e:
+            self.done.emit(False, {}, str(e))
 
 # -------------------- GUI Class --------------------
 class CursorManagerWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        self._font_title = QFont("Arial", 14, QFont.Bold)
+        self._font_small = QFont("Arial", 9)
+        self._font_mono = QFont("Consolas", 9)
+
         self.setWindowTitle("Cursor Manager")
         self.setFixedSize(500, 300)
 
         self.db_manager = DatabaseManager()
+        self._rendered_ids: Optional[str] = None
+        self._closing = False
+        self.update_worker: Optional[UpdateWorker] = None
+        self.id_worker: Optional[IDChangeWorker] = None
+
+        base = os.environ.get('LOCALAPPDATA') or str(Path.home() / '.local/share')
+        self._updater_path = Path(base) / 'cursor-updater'
 
         icon_path = resource_path("icon.ico")
         self.setWindowIcon(QIcon(icon_path))
 
         self.initUI()
 
+    def closeEvent(self, event):
+        """ Pencere kapanırken WAL dosyasını ana veritabanına aktarır ve bağlantıyı kapatır."""
+        # Kuyrukta bekleyen done sinyalleri kapalı veritabanına yazmaya çalışmasın
+        self._closing = True
+        self.wait_for_workers()
+        try:
+            self.db_manager.close()
+        finally:
+            super().closeEvent(event)
+
+    def wait_for_workers(self):
+        """ Çalışan arka plan iş parçacıklarının bitmesini bekler."""
+        for worker in (self.update_worker, self.id_worker):
+            if worker is not None and worker.isRunning():
+                worker.wait()
+
+    def track_worker(self, attr: str, worker: QThread):
+        """ Worker'ı kaydeder; bittiğinde silinmesini ve referansın bırakılmasını sağlar."""
+        setattr(self, attr, worker)
+
+        def release():
+            if getattr(self, attr) is worker:
+                setattr(self, attr, None)
+
+        worker.finished.connect(release)
+        worker.finished.connect(worker.deleteLater)
+
     def initUI(self):
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -178,15 +411,15 @@ class CursorManagerWindow(QMainWindow):
 
         self.update_status = QLabel()
         self.update_status.setAlignment(Qt.AlignRight)
-        self.update_status.setFont(QFont("Arial", 9))
+        self.update_status.setFont(self._font_small)
 
         title_label = QLabel("Cursor Güncelleme Kontrolü")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setFont(self._font_title)
         title_label.setAlignment(Qt.AlignCenter)
 
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setFont(QFont("Arial", 9))
+        self.status_label.setFont(self._font_small)
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)
@@ -211,7 +444,7 @@ class CursorManagerWindow(QMainWindow):
 
         last_operation, timestamp = self.db_manager.get_last_operation()
         if last_operation:
-            self.update_status.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            set_label_state(self.update_status, "err")
             self.update_status.setText(f"Son işlem: {last_operation} - {timestamp}")
         else:
             self.update_status.setText("Henüz işlem yapılmadı")
@@ -221,16 +454,18 @@ class CursorManagerWindow(QMainWindow):
         layout = QVBoxLayout(id_tab)
 
         title_label = QLabel("Cursor Multi ID Değiştirme")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setFont(self._font_title)
         title_label.setAlignment(Qt.AlignCenter)
 
         self.current_ids = QTextEdit()
         self.current_ids.setReadOnly(True)
-        self.current_ids.setFont(QFont("Consolas", 9))
+        self.current_ids.setUndoRedoEnabled(False)
+        self.current_ids.setAcceptRichText(False)
+        self.current_ids.setFont(self._font_mono)
 
         self.id_status_label = QLabel("")
         self.id_status_label.setAlignment(Qt.AlignCenter)
-        self.id_status_label.setFont(QFont("Arial", 9))
+        self.id_status_label.setFont(self._font_small)
 
         self.id_button = QPushButton("ID'leri Yeniden Oluştur")
         self.id_button.clicked.connect(self.change_ids)
@@ -247,99 +482,82 @@ class CursorManagerWindow(QMainWindow):
 
     def show_previous_ids(self):
         """Veritabanındaki daha önce değiştirilen ID'leri ekranda göster."""
-        cursor = self.db_manager.connection.cursor()
-        cursor.execute("SELECT operation, timestamp FROM operations WHERE operation LIKE 'ID%' ORDER BY id DESC")
-        results = cursor.fetchall()
-
-        if results:
-            ids_output = "\n".join([f"{operation} - {timestamp}" for operation, timestamp in results])
-            self.current_ids.setText(ids_output)
-        else:
-            self.current_ids.setText("Henüz ID değiştirilmedi.")
+        if self._rendered_ids is None:
+            buf = []
+            append = buf.append
+            for operation, timestamp in self.db_manager.get_id_rows():
+                append(operation)
+                append(" - ")
+                append(timestamp)
+                append("\n")
+
+            if buf:
+                buf.pop()  # Son satır sonu
+                self._rendered_ids = "".join(buf)
+            else:
+                self._rendered_ids = "Henüz ID değiştirilmedi."
+
+        self.current_ids.setPlainText(self._rendered_ids)
 
     def block_updates(self):
-        local_path = os.path.join(os.environ['LOCALAPPDATA'])
-        cursor_update_path = os.path.join(local_path, 'cursor-updater')
-
-        self.progress_bar.setValue(50)
-
-        try:
-
-            if os.path.exists(cursor_update_path):
-                if os.path.isdir(cursor_update_path):
-                    shutil.rmtree(cursor_update_path)
-                else:
-                    os.remove(cursor_update_path)
-            
-
-            Path(cursor_update_path).touch()
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-            self.status_label.setText("✅ İşlem başarılı: Güncellemeler engellendi")
-            notification.notify(
-                title="Cursor Güncelleme Kontrolü",
-                message="Güncellemeler engellendi.",
-                timeout=5
-            )
-            self.progress_bar.setValue(100)
-
-            self.db_manager.insert_operation("Güncellemeler engellendi")
-
-        except Exception as e:
-
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-            self.status_label.setText(f"❌ Hata oluştu: {str(e)}")
-            self.progress_bar.setValue(0)
-
-
-        self.check_update_status()
+        if self._updater_path.is_file() and self._updater_path.stat().st_size == 0:
+            set_label_state(self.status_label, "ok")
+            self.status_label.setText("✅ Güncellemeler zaten engellenmiş")
+            self.check_update_status()
+            return
+        self.start_update_worker(block=True)
 
     def enable_updates(self):
-        local_path = os.path.join(os.environ['LOCALAPPDATA'])
-        cursor_update_path = os.path.join(local_path, 'cursor-updater')
-
-        self.progress_bar.setValue(50)
-
-        try:
-
-            if os.path.exists(cursor_update_path):
-                if os.path.isdir(cursor_update_path):
-                    shutil.rmtree(cursor_update_path)
-                else:
-                    os.remove(cursor_update_path)
-            
-
-            os.makedirs(cursor_update_path)
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-            self.status_label.setText("✅ İşlem başarılı: Güncellemeler aktifleştirildi")
-            notification.notify(
-                title="Cursor Güncelleme Kontrolü",
-                message="Güncellemeler aktifleştirildi.",
-                timeout=5
-            )
-            self.progress_bar.setValue(100)
+        if self._updater_path.is_dir():
+            set_label_state(self.status_label, "ok")
+            self.status_label.setText("✅ Güncellemeler zaten aktif")
+            self.check_update_status()
+            return
+        self.start_update_worker(block=False)
 
+    def start_update_worker(self, block: bool):
+        """ Güncelleme işlemini arka plan iş parçacığında başlatır."""
+        self.block_button.setEnabled(False)
+        self.enable_button.setEnabled(False)
+        self.progress_bar.setValue(0)
 
-            self.db_manager.insert_operation("Güncellemeler aktifleştirildi")
+        worker = UpdateWorker(self._updater_path, block, self)
+        worker.progress.connect(self.progress_bar.setValue)
+        worker.done.connect(self.on_update_finished)
+        self.track_worker("update_worker", worker)
+        worker.start()
 
+    def on_update_finished(self, success: bool, error: str):
+        """ Arka plan işlemi bittiğinde arayüzü ve veritabanını günceller."""
+        if self._closing:
+            return
+        try:
+            if success:
+                message = "Güncellemeler engellendi" if self.update_worker.block else "Güncellemeler aktifleştirildi"
+                self.db_manager.insert_operation(message, "UPDATE")
+
+                set_label_state(self.status_label, "ok")
+                self.status_label.setText(f"✅ İşlem başarılı: {message}")
+                send_notification("Cursor Güncelleme Kontrolü", f"{message}.")
+            else:
+                set_label_state(self.status_label, "err")
+                self.status_label.setText(f"❌ Hata oluştu: {error}")
+                self.progress_bar.setValue(0)
         except Exception as e:
-
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            set_label_state(self.status_label, "err")
             self.status_label.setText(f"❌ Hata oluştu: {str(e)}")
-            self.progress_bar.setValue(0)
-
-
-        self.check_update_status()
+        finally:
+            self.block_button.setEnabled(True)
+            self.enable_button.setEnabled(True)
+            self.check_update_status()
 
     def check_update_status(self):
         """ Güncellemelerin durumunu kontrol eder ve gösterir. """
-        local_path = os.path.join(os.environ['LOCALAPPDATA'])
-        cursor_update_path = os.path.join(local_path, 'cursor-updater')
-
-        if os.path.exists(cursor_update_path):
-            self.update_status.setStyleSheet("color: #27ae60; font-weight: bold;")
+        if self._updater_path.exists():
+            set_label_state(self.update_status, "ok")
             self.update_status.setText("✅ Güncellemeler Aktif")
         else:
-            self.update_status.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            set_label_state(self.update_status, "err")
             self.update_status.setText("❌ Güncellemeler Engellenmiş")
 
     def change_ids(self):
@@ -348,24 +566,42 @@ class CursorManagerWindow(QMainWindow):
             self.id_status_label.setText("❌ Yönetici yetkisi gerekli!")
             return
 
+        self.id_button.setEnabled(False)
+
+        worker = IDChangeWorker(self)
+        worker.done.connect(self.on_ids_changed)
+        self.track_worker("id_worker", worker)
+        worker.start()
 
-        id_gen = IDGenerator()
+    def on_ids_changed(self, success: bool, ids: dict, error: str):
+        """ Üretilen ID'leri ekrana yazar ve veritabanına kaydeder."""
+        if self._closing:
+            return
+        self.id_button.setEnabled(True)
+        if not success:
+            self.id_status_label.setText(f"❌ Hata oluştu: {error}")
+            return
 
-        machine_id = id_gen.generate_machine_id()
-        mac_machine_id = id_gen.generate_mac_machine_id()
-        device_id = id_gen.generate_device_id()
-        sqm_id = id_gen.generate_sqm_id()
+        machine_id = ids["machine_id"]
+        mac_machine_id = ids["mac_machine_id"]
+        device_id = ids["device_id"]
+        sqm_id = ids["sqm_id"]
 
-        kill_cursor_processes()
         ids_output = f"""Machine ID: {machine_id}
 Mac Machine ID: {mac_machine_id}
 Device ID: {device_id}
 SQM ID: {sqm_id}"""
 
-        self.current_ids.setText(ids_output)
+        self.current_ids.setPlainText(ids_output)
         self.id_status_label.setText("✅ ID'ler başarıyla değiştirildi!")
 
-        self.db_manager.insert_operation(f"ID'ler değiştirildi: {machine_id}, {mac_machine_id}, {device_id}, {sqm_id}")
+        self.db_manager.insert_operations([
+            f"ID'ler değiştirildi - Machine ID: {machine_id}",
+            f"ID'ler değiştirildi - Mac Machine ID: {mac_machine_id}",
+            f"ID'ler değiştirildi - Device ID: {device_id}",
+            f"ID'ler değiştirildi - SQM ID: {sqm_id}",
+        ], "ID")
+        self._rendered_ids = None
 
 def main():
     app = QApplication(sys.argv)